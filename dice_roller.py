@@ -1,6 +1,7 @@
 #!/usr/bin/python3
 
-from cursor import cursor, rollback_if_false, ParserError
+from cursor import cursor, ParserError
+import operator
 import random
 import re
 import sys
@@ -8,6 +9,12 @@ import sys
 from collections.abc import Callable
 from typing import Optional
 
+# numpy is optional; when it's available we use it to roll large dice pools in a single batch.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # Colors we output to the terminal.
 class term_colors:
     DUMP_ROLL_TEXT = "\033[93m"
@@ -23,44 +30,176 @@ class term_colors:
 # A regex to match decimal integer numbers
 int_regex = re.compile(r"[1-9][0-9]*")
 
-# A regex to match a "2d6" style expression
-n_d_k_regex = re.compile(
-    r"(?P<dice_count>[1-9][0-9]*)\s*[dD]\s*(?P<die_size>[1-9][0-9]*)"
+# A regex to match a value, either an integer constant or a "2d6" style expression.
+# The die size is optional so that a missing die size can be reported as an error, rather than the "d" being left over.
+value_regex = re.compile(
+    r"(?P<dice_count>[1-9][0-9]*)(?:\s*(?P<d>[dD])\s*(?P<die_size>[1-9][0-9]*)?)?"
 )
 
+# A regex to match the name of a unary operator function, such as "max" or "top"
+operator_regex = re.compile(r"(max|min|sum|top|bottom|count)\b")
+
+# Regexes to match the binary operators at each level of precedence, from loosest to tightest binding
+concat_operator_regex = re.compile(r",")
+additive_operator_regex = re.compile(r"[-+]")
+multiplicative_operator_regex = re.compile(r"[*/]")
+
+# Dice pools at or below this size are rolled one die at a time, since the setup cost of a batch roll outweighs its
+# savings.
+batch_min_dice_count = 4
+
+# The largest die that random.choices is used for. choices picks each die as floor(random() * die), which is only
+# approximately uniform (randint is exactly uniform) because random() has 53 bits of precision. Up to 2**32 sides the
+# bias is below 1 part in 2**21, which is accepted for the speedup; bigger dice use randint.
+choices_max_die = 2**32
+
+# The random number generator used to batch roll dice pools, if numpy is available.
+_rng = np.random.default_rng() if np is not None else None
+
+
+def _roll_dice(
+    count: int, die: int, _choices=random.choices, _randint=random.randint
+) -> list[int]:
+    """
+    Rolls `count` dice with `die` sides, returning the rolls in the order they were rolled.
+    """
+    if count <= batch_min_dice_count or die > choices_max_die:
+        return [_randint(1, die) for _ in range(count)]
+    elif _rng is not None:
+        # Roll the whole pool in one call, and only convert back to a python list at the end
+        return _rng.integers(1, die + 1, size=count, dtype=np.int64).tolist()
+    else:
+        # choices is still a python loop, but each die skips the argument handling randint does through randrange
+        return _choices(range(1, die + 1), k=count)
+
+
+def _op_max(s: list[int]) -> list[int]:
+    return [max(s)]
+
+
+def _op_min(s: list[int]) -> list[int]:
+    return [min(s)]
+
+
+def _op_sum(s: list[int]) -> list[int]:
+    return [sum(s)]
+
+
+def _int_div(a: int, b: int) -> int:
+    # Round towards zero (like int(a / b) would), but without the round trip through a float
+    q = abs(a) // abs(b)
+    return q if (a < 0) == (b < 0) else -q
+
+
+def _op_add(l: list[int], r: list[int]) -> list[int]:
+    return [sum(l) + sum(r)]
+
+
+def _op_sub(l: list[int], r: list[int]) -> list[int]:
+    return [sum(l) - sum(r)]
+
+
+def _op_mul(l: list[int], r: list[int]) -> list[int]:
+    return [sum(l) * sum(r)]
+
+
+def _op_div(l: list[int], r: list[int]) -> list[int]:
+    return [_int_div(sum(l), sum(r))]
+
+
+def _op_concat(l: list[int], r: list[int]) -> list[int]:
+    # Both sides are sorted before being passed in, so the joined list is two sorted runs, which sort() merges in
+    # linear time. This is much faster than heapq.merge, which merges one item at a time in python.
+    result = l + r
+    result.sort()
+    return result
+
+
+# The binary operators, mapping the operator character to the operation method, the name of the operator,
+# whether the operator needs its rolls in ascending order, and the function used to fold two constants together at
+# parse time (or None if the operator can't be folded).
+binary_operators = {
+    "+": (_op_add, "Sum", False, operator.add),
+    "-": (_op_sub, "Subtract", False, operator.sub),
+    "*": (_op_mul, "Multiply", False, operator.mul),
+    "/": (_op_div, "Divide", False, _int_div),
+    ",": (_op_concat, "Concat", True, None),
+}
+
+# Templates for the python source of a binary operator's total, given the source for the totals of each side. Used by
+# roller_binary_op.compile_to_source. The total of a concat is the total of both sides, same as a sum.
+_binary_op_sources = {
+    _op_add: "({} + {})",
+    _op_sub: "({} - {})",
+    _op_mul: "({} * {})",
+    _op_div: "div({}, {})",
+    _op_concat: "({} + {})",
+}
+
+# Templates for the python source of a unary operator's total, given the source for the rolls it's applied to.
+_unary_op_sources = {
+    _op_max: "max({})",
+    _op_min: "min({})",
+    _op_sum: "sum({})",
+}
+
 
 class roll_result:
     """
     The result of a dice roll
     """
 
+    __slots__ = ("_r", "_hdr", "_inner", "_color", "_sorted", "_total")
+
     def __init__(
-        self, result: list[int], header: str, inner_results: list["roll_result"]
+        self,
+        result: list[int],
+        header: str,
+        inner_results: list["roll_result"],
+        color: str,
+        is_sorted: bool = False,
     ) -> None:
         """
         Args:
           result: The list of numbers in this result
           header: The title of this stage of the roll result tree
           inner_results: The actual roll_result objects describing the integer result array
+          color: The terminal color to print the numbers in this result with (one of the term_colors values)
+          is_sorted: True if result is already known to be in ascending order.
         """
-        self.__r = result
-        self.__hdr = header
-        self.__inner = inner_results
+        self._r = result
+        self._hdr = header
+        self._inner = inner_results
+        self._color = color
+        self._sorted = is_sorted or len(result) < 2
+        # Most operators reduce to a single number, in which case that number is the total
+        self._total = result[0] if len(result) == 1 else None
 
     @property
     def values(self) -> list[int]:
-        return self.__r
+        """
+        The numbers in this result, in no particular order.
+        """
+        return self._r
 
     @property
-    def dump_mode(self):
-        # Based on our header, change the color of our output.
-        # TODO: better way to do this is to have the color defined as part of our constructor.
-        if self.__hdr == "const":
-            return term_colors.DUMP_ROLL_CONST
-        elif n_d_k_regex.fullmatch(self.__hdr) is not None:
-            return term_colors.DUMP_ROLL_VALUES
-        else:
-            return term_colors.DUMP_ROLL_CALC
+    def total(self) -> int:
+        """
+        The sum of the numbers in this result. Only summed the first time it is needed.
+        """
+        if self._total is None:
+            self._total = sum(self._r)
+        return self._total
+
+    @property
+    def sorted_values(self) -> list[int]:
+        """
+        The numbers in this result in ascending order. Sorts the result the first time it is needed.
+        """
+        if not self._sorted:
+            self._r.sort()
+            self._sorted = True
+        return self._r
 
     def dump(self, *, indent="", add_indent="    "):
         """
@@ -70,11 +209,12 @@ class roll_result:
           indent: The initial indentation string. Defaults to an empty string for no indentation at the first level.
           add_indent: What to add to the indentation string for each indentation. Defaults to 4 spaces.
         """
-        r = ", ".join(f"{self.dump_mode}{i}{term_colors.RESET}" for i in self.__r)
+        # Color the list as a whole, rather than each number in it
+        r = f"{self._color}{', '.join(map(str, self._r))}{term_colors.RESET}"
         print(
-            f"{indent}{term_colors.DUMP_ROLL_TEXT}{self.__hdr}{term_colors.RESET} : {r}"
+            f"{indent}{term_colors.DUMP_ROLL_TEXT}{self._hdr}{term_colors.RESET} : {r}"
         )
-        for inner in self.__inner:
+        for inner in self._inner:
             inner.dump(indent=indent + add_indent, add_indent=add_indent)
 
 
@@ -83,27 +223,48 @@ class roller_base:
     The base class for dice roller AST nodes.
     """
 
+    __slots__ = ()
+
     def roll(self) -> roll_result:
         """
         The base roller function for all dice roller AST nodes.
         """
         raise NotImplementedError
 
+    def compile_to_source(self) -> Optional[str]:
+        """
+        Generates a python expression that evaluates to the total of a roll of this node, for use by compile_roll.
+        The expression may call `roll(count, die)`, `randint(a, b)`, and `div(a, b)`.
+
+        Returns:
+          The python expression, or None if this node can't be compiled and has to be rolled through roll().
+        """
+        return None
+
 
 class roller_constant(roller_base):
     """
     A dice roll representing a const value, usually a modifier.
     """
 
+    __slots__ = ("_constant",)
+
     def __init__(self, c: int) -> None:
         """
         Args:
           c: The integer constant.
         """
-        self.__constant = c
+        self._constant = c
+
+    @property
+    def value(self) -> int:
+        return self._constant
 
     def roll(self) -> roll_result:
-        return roll_result([self.__constant], "const", [])
+        return roll_result([self._constant], "const", [], term_colors.DUMP_ROLL_CONST)
+
+    def compile_to_source(self) -> Optional[str]:
+        return f"({self._constant})"
 
 
 class roller_die(roller_base):
@@ -111,6 +272,8 @@ class roller_die(roller_base):
     A dice roll that is representative of a 2d6 style expression. Result will be the simulated dice roll.
     """
 
+    __slots__ = ("_c", "_d")
+
     def __init__(self, count: int, die: int) -> None:
         """
 
@@ -118,12 +281,26 @@ class roller_die(roller_base):
           count: The number of dice to roll.
           die: The size die to roll.
         """
-        self.__c = count
-        self.__d = die
+        self._c = count
+        self._d = die
 
     def roll(self) -> roll_result:
-        l = [random.randint(1, self.__d) for _ in range(self.__c)]
-        return roll_result(sorted(l), f"{self.__c}d{self.__d}", [])
+        # Rolls are left unsorted; only the operators that care about order will sort them.
+        l = _roll_dice(self._c, self._d)
+        return roll_result(
+            l, f"{self._c}d{self._d}", [], term_colors.DUMP_ROLL_VALUES
+        )
+
+    def compile_to_source(self) -> Optional[str]:
+        if self._c == 1:
+            return f"randint(1, {self._d})"
+        return f"sum(roll({self._c}, {self._d}))"
+
+    def compile_rolls_to_source(self) -> str:
+        """
+        Generates a python expression that evaluates to the list of rolls of this node, for use by unary operators.
+        """
+        return f"roll({self._c}, {self._d})"
 
 
 class roller_unary_operator(roller_base):
@@ -131,8 +308,14 @@ class roller_unary_operator(roller_base):
     A unary operator node in the dice roller AST
     """
 
+    __slots__ = ("_i", "_c", "_t", "_ordered")
+
     def __init__(
-        self, inner: roller_base, op: Callable[[list[int]], list[int]], title: str
+        self,
+        inner: roller_base,
+        op: Callable[[list[int]], list[int]],
+        title: str,
+        ordered: bool = False,
     ) -> None:
         """
         Args:
@@ -141,15 +324,30 @@ class roller_unary_operator(roller_base):
             The operation method, which is a function that takes the rolls from the value this operator is applied
             to, and returns the rolls that the operator results in.
           title: A string representing the name of this operator, to use when outputting an audit.
+          ordered:
+            True if op needs its rolls in ascending order. op must then also return its result in ascending order.
         """
-        self.__i = inner
-        self.__c = op
-        self.__t = title
+        self._i = inner
+        self._c = op
+        self._t = title
+        self._ordered = ordered
 
     def roll(self) -> roll_result:
-        r = self.__i.roll()
-        result = self.__c(r.values)
-        return roll_result(result, self.__t, [r])
+        r = self._i.roll()
+        if self._ordered:
+            result = self._c(r.sorted_values)
+        else:
+            result = self._c(r.values)
+        return roll_result(
+            result, self._t, [r], term_colors.DUMP_ROLL_CALC, self._ordered
+        )
+
+    def compile_to_source(self) -> Optional[str]:
+        # Only max/min/sum applied directly to dice are compiled; the rest need the full list of rolls
+        template = _unary_op_sources.get(self._c)
+        if template is None or not isinstance(self._i, roller_die):
+            return None
+        return template.format(self._i.compile_rolls_to_source())
 
 
 class roller_binary_op(roller_base):
@@ -158,12 +356,15 @@ class roller_binary_op(roller_base):
     That is, an operator that takes two rolls and returns a single roll.
     """
 
+    __slots__ = ("_l", "_r", "_op", "_op_str", "_ordered")
+
     def __init__(
         self,
         lhs: roller_base,
         rhs: roller_base,
         op: Callable[[list[int], list[int]], list[int]],
         op_str: str,
+        ordered: bool = False,
     ):
         """
         Args:
@@ -173,17 +374,36 @@ class roller_binary_op(roller_base):
             The operation method, which is a function that takes the rolls from rhs and lhs (as `list[int]`'s)
             and returns the result of the binary operation as a single list[int]
           op_str: A string representing the name of this operator, to use when outputting an audit.
+          ordered:
+            True if op needs the rolls from both sides in ascending order. op must then also return its result in
+            ascending order.
         """
-        self.__l = lhs
-        self.__r = rhs
-        self.__op = op
-        self.__op_str = op_str
+        self._l = lhs
+        self._r = rhs
+        self._op = op
+        self._op_str = op_str
+        self._ordered = ordered
 
     def roll(self) -> roll_result:
-        l = self.__l.roll()
-        r = self.__r.roll()
-        result = self.__op(l.values, r.values)
-        return roll_result(result, self.__op_str, [l, r])
+        l = self._l.roll()
+        r = self._r.roll()
+        if self._ordered:
+            result = self._op(l.sorted_values, r.sorted_values)
+        else:
+            result = self._op(l.values, r.values)
+        return roll_result(
+            result, self._op_str, [l, r], term_colors.DUMP_ROLL_CALC, self._ordered
+        )
+
+    def compile_to_source(self) -> Optional[str]:
+        template = _binary_op_sources.get(self._op)
+        if template is None:
+            return None
+        l = self._l.compile_to_source()
+        r = self._r.compile_to_source()
+        if l is None or r is None:
+            return None
+        return template.format(l, r)
 
 
 class roller_cursor(cursor):
@@ -196,98 +416,142 @@ class roller_cursor(cursor):
         """
         super(roller_cursor, self).__init__(line)
 
-    @rollback_if_false
-    def accept_value(self) -> Optional[roller_base]:
+    # The accept_* methods bind the module level regexes and tables they use as default arguments, so the parser's hot
+    # path looks them up as locals instead of globals. These arguments are never passed by callers.
+
+    def accept_value(
+        self, _value_regex=value_regex, _int=int
+    ) -> Optional[roller_base]:
         """
           Accepts an expression resulting in a single value.
         """
+        rollback = self._pos
         if self.accept_punctuation("("):
             roll = self.accept_roll()
             self.expect_punctuation(")")
+            if not roll:
+                self._pos = rollback
             return roll
         else:
-            count = self.accept_regex_str(int_regex)
-            if count is None:
+            m = self.accept_regex(_value_regex)
+            if m is None:
                 return None
-            count = int(count)
-            if self.accept_punctuation("d"):
-                die = self.expect_regex_str(int_regex, "integer")
-                die = int(die)
-                return roller_die(count, die)
-            else:
+            count = _int(m.group("dice_count"))
+            if m.group("d") is None:
                 return roller_constant(count)
-
-    @rollback_if_false
-    def accept_operator(self) -> Optional[roller_base]:
+            die = m.group("die_size")
+            if die is None:
+                raise self.create_parser_error("expected integer")
+            return roller_die(count, _int(die))
+
+    def accept_operator(
+        self, _operator_regex=operator_regex, _int_regex=int_regex, _int=int
+    ) -> Optional[roller_base]:
         """
           Accepts the use of a unary operator. Descends into checking for a value.
         """
+        rollback = self._pos
+
         # Assign our operator based on the function
-        if self.accept_keyword("max"):
-            op = lambda s: [s[0] if len(s) == 1 else max(*s)]
-            op_name = "max"
-        elif self.accept_keyword("min"):
-            op = lambda s: [s[0] if len(s) == 1 else min(*s)]
-            op_name = "min"
-        elif self.accept_keyword("sum"):
-            op = lambda s: [sum(s)]
-            op_name = "sum"
-        elif self.accept_keyword("top"):
-            count = self.expect_regex_str(int_regex, "integer")
-            count = int(count)
-            op = lambda s: s[-count:]
-            op_name = f"top {count}"
-        elif self.accept_keyword("bottom"):
-            count = self.expect_regex_str(int_regex, "integer")
-            count = int(count)
-            op = lambda s: s[0:count]
-            op_name = f"bottom {count}"
-        elif self.accept_keyword("count"):
-            count = self.expect_regex_str(int_regex, "integer")
-            count = int(count)
-            op = lambda s: [sum(1 for i in s if i == count)]
-            op_name = f"count {count}"
-        else:
+        m = self.accept_regex(_operator_regex)
+        if m is None:
             # Default case - not a function, try parsing just value
             return self.accept_value()
 
+        op_name = m.group(1)
+        ordered = False
+        if op_name == "max":
+            op = _op_max
+        elif op_name == "min":
+            op = _op_min
+        elif op_name == "sum":
+            op = _op_sum
+        else:
+            # top, bottom and count all take an integer argument
+            count = self.expect_regex_str(_int_regex, "integer")
+            count = _int(count)
+            if op_name == "top":
+                op = lambda s: s[-count:]
+                ordered = True
+            elif op_name == "bottom":
+                op = lambda s: s[0:count]
+                ordered = True
+            else:
+                op = lambda s: [operator.countOf(s, count)]
+            op_name = f"{op_name} {count}"
+
         roller = self.accept_value()
         if not roller:
+            self._pos = rollback
             return None
-        return roller_unary_operator(roller, op, op_name)
-
-    @rollback_if_false
-    def accept_roll(self) -> Optional[roller_base]:
-        """
-          Accepts an entire roll expression as
-        """
-        op1 = self.accept_operator()
-
-        if self.accept_punctuation("+"):
-            op2 = self.expect_roll()
-            return roller_binary_op(
-                op1, op2, (lambda l, r: [int(sum(l) + sum(r))]), "Sum"
-            )
-        elif self.accept_punctuation("-"):
-            op2 = self.expect_roll()
-            return roller_binary_op(
-                op1, op2, (lambda l, r: [int(sum(l) - sum(r))]), "Subtract"
-            )
-        elif self.accept_punctuation("*"):
-            op2 = self.expect_roll()
-            return roller_binary_op(
-                op1, op2, (lambda l, r: [int(sum(l) * sum(r))]), "Multiply"
-            )
-        elif self.accept_punctuation("/"):
-            op2 = self.expect_roll()
-            return roller_binary_op(
-                op1, op2, (lambda l, r: [int(sum(l) / sum(r))]), "Divide"
-            )
-        elif self.accept_punctuation(","):
-            op2 = self.expect_roll()
-            return roller_binary_op(op1, op2, (lambda l, r: sorted(l + r)), "Concat")
-        else:
-            return op1
+        return roller_unary_operator(roller, op, op_name, ordered)
+
+    def accept_roll(
+        self, _concat_operator_regex=concat_operator_regex
+    ) -> Optional[roller_base]:
+        """
+          Accepts an entire roll expression. `,` binds loosest, then `+` and `-`, then `*` and `/`.
+        """
+        return self.accept_binary_chain(_concat_operator_regex, self.accept_sum)
+
+    def accept_sum(
+        self, _additive_operator_regex=additive_operator_regex
+    ) -> Optional[roller_base]:
+        """
+          Accepts a chain of rolls joined by `+` or `-`.
+        """
+        return self.accept_binary_chain(_additive_operator_regex, self.accept_product)
+
+    def accept_product(
+        self, _multiplicative_operator_regex=multiplicative_operator_regex
+    ) -> Optional[roller_base]:
+        """
+          Accepts a chain of rolls joined by `*` or `/`.
+        """
+        return self.accept_binary_chain(
+            _multiplicative_operator_regex, self.accept_operator
+        )
+
+    def accept_binary_chain(
+        self,
+        regex: re.Pattern,
+        accept_operand: Callable[[], Optional[roller_base]],
+        _binary_operators=binary_operators,
+    ) -> Optional[roller_base]:
+        """
+          Accepts a chain of operands joined by the binary operators matched by regex.
+
+        Args:
+          regex: The regex matching the binary operators at this level of precedence.
+          accept_operand: The accept method for the operands, which are the next tighter binding level.
+        """
+        op1 = accept_operand()
+        if not op1:
+            # accept_operand already rolled back anything it consumed
+            return None
+
+        # Fold the chain from left to right, e.g. `a - b - c` is `(a - b) - c`
+        while True:
+            m = self.accept_regex(regex)
+            if m is None:
+                return op1
+
+            op2 = accept_operand()
+            if not op2:
+                raise self.create_parser_error("expected a roll")
+
+            op, op_str, ordered, fold = _binary_operators[m.group(0)]
+            if (
+                fold is not None
+                and isinstance(op1, roller_constant)
+                and isinstance(op2, roller_constant)
+                and not (fold is _int_div and op2.value == 0)
+            ):
+                # Both sides are constants, so work out the result now rather than on every roll. Division by zero is
+                # left alone so it still fails when rolled, like any other division by zero.
+                op1 = roller_constant(fold(op1.value, op2.value))
+            else:
+                op1 = roller_binary_op(op1, op2, op, op_str, ordered)
 
     def expect_roll(self) -> roller_base:
         """
@@ -318,8 +582,58 @@ class roller_cursor(cursor):
         return roll
 
 
+def parse_roll(line: str) -> roller_base:
+    """
+    Parses a line of text into a dice roller AST, which can then be rolled any number of times without parsing the
+    line again. Raises a parser error on failure to parse the text.
+
+    Args:
+      line: The line of text.
+    """
+    return roller_cursor(line).expect_line()
+
+
+def compile_roll(roller: roller_base) -> Callable[[], int]:
+    """
+    Compiles a parsed roll into a single python function that rolls it and returns the total, without walking the AST
+    or building roll_results. If the roll can't be compiled, the returned function rolls the AST instead.
+
+    Args:
+      roller: The AST node to compile, as returned by parse_roll.
+    """
+    try:
+        src = roller.compile_to_source()
+        if src is None:
+            return lambda: roller.roll().total
+
+        # The source is only ever built from integers and the templates above, so it's safe to evaluate
+        namespace = {"roll": _roll_dice, "randint": random.randint, "div": _int_div}
+        fn = eval(f"lambda: {src}", namespace)
+    except (SyntaxError, RecursionError):
+        # Long chains of operators nest deeper than python's parser (or the recursion limit) allows
+        return lambda: roller.roll().total
+
+    return fn
+
+
+def roll_many(roller: roller_base, n: int) -> list[int]:
+    """
+    Rolls a parsed roll `n` times.
+
+    Args:
+      roller: The AST node to roll, as returned by parse_roll.
+      n: The number of times to roll.
+
+    Returns:
+      The total of each roll.
+    """
+    fn = compile_roll(roller)
+    return [fn() for _ in range(n)]
+
+
 if __name__ == '__main__':
   last_line = ""
+  last_roller = None
   last_result = None
   prompt_str = "dice> "
 
@@ -341,20 +655,20 @@ if __name__ == '__main__':
           continue
       elif line == "":
           line = last_line
-      else:
-          last_line = line
 
-      c = roller_cursor(line)
       try:
-          roller = c.expect_line()
-          result = roller.roll()
+          # Only parse the line if it changed, so hitting enter to reroll the last line just rolls it again
+          if last_roller is None or line != last_line:
+              last_line = line
+              last_roller = None
+              last_roller = parse_roll(line)
+          result = last_roller.roll()
           last_result = result
-          print(f"{term_colors.TOTAL_VALUE}{sum(result.values)}{term_colors.RESET}")
+          print(f"{term_colors.TOTAL_VALUE}{result.total}{term_colors.RESET}")
       except ParserError as e:
-          indent = ' ' * len(prompt_str)
-          arrow = f"{term_colors.ERROR_ARROW}{'-' * e.position}^"
-          text = f"{term_colors.ERROR_TEXT}{e}{term_colors.RESET}"
+          # Point an arrow at where the error is, lined up under the input after the prompt
           print(
-              f'{indent}{arrow} {text}',
+              f"{'':<{len(prompt_str)}}{term_colors.ERROR_ARROW}{'':-<{e.position}}^ "
+              f"{term_colors.ERROR_TEXT}{e}{term_colors.RESET}",
               file=sys.stderr,
           )